@@ -6,291 +6,527 @@ BibTeX文件解析器 - 将.bib文件转换为Excel表格
 """
 
 import re
+import string
+import unicodedata
 import pandas as pd
+import mmap
 import os
-from typing import Dict, List, Any
+import sys
+from collections import Counter
+from functools import lru_cache
+from multiprocessing import Pool
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+from typing import Dict, List, Any, Tuple
 
-def clean_field_value(value: str) -> str:
+try:
+    import xlsxwriter
+except ImportError:  # 未安装xlsxwriter时回退到openpyxl
+    xlsxwriter = None
+
+# LaTeX重音符号与对应的Unicode组合字符
+_ACCENT_MARKS = {
+    '~': '\u0303',  # 波浪符
+    "'": '\u0301',  # 尖音符
+    '`': '\u0300',  # 重音符
+    '"': '\u0308',  # 分音符/元音变音
+    '^': '\u0302',  # 扬抑符
+}
+
+# (重音符号, 字母) -> 预组合的Unicode字符，如 ("'", 'a') -> 'á'；
+# 只收录存在单个预组合字符的组合
+_ACCENT_MAP = {
+    (accent, letter): unicodedata.normalize('NFC', letter + mark)
+    for accent, mark in _ACCENT_MARKS.items()
+    for letter in string.ascii_letters
+    if len(unicodedata.normalize('NFC', letter + mark)) == 1
+}
+
+# 同时匹配带花括号（\'{a}）和不带花括号（\'a）的写法，一次扫描完成全部重音替换；
+# 不带花括号的写法要求字母后为单词边界，避免把URL中的 \~alice 之类误转换
+_ACCENT_RE = re.compile(r"""\\([~'`"^])(?:\{([a-zA-Z])\}|([a-zA-Z])\b)""")
+
+# 其他LaTeX特殊字符映射表（键为原始文本，而非正则表达式）
+_LATEX_TABLE = {
+    # 软音符 cedilla (c)
+    r'\c{c}': 'ç', r'\c{C}': 'Ç',
+}
+
+# 以字母结尾的命令，需要单词边界，避免 \o 误匹配 \oe 之类的前缀
+_LATEX_WORD_TABLE = {
+    # 其他特殊字符
+    r'\ss': 'ß',  # 德语 eszett
+    r'\ae': 'æ', r'\AE': 'Æ',  # ae连字
+    r'\oe': 'œ', r'\OE': 'Œ',  # oe连字
+    r'\o': 'ø', r'\O': 'Ø',    # 斜杠o
+    r'\aa': 'å', r'\AA': 'Å',  # 环形a
+    
+    # 西班牙语倒置标点
+    r'\textquestiondown': '¿',
+    r'\textexclamdown': '¡',
+}
+
+def _alternation(keys) -> str:
+    """
+    将原始文本键合并为一个正则分支，较长的键优先以避免前缀冲突
+    """
+    return '|'.join(re.escape(k) for k in sorted(keys, key=len, reverse=True))
+
+# 每张映射表合并为一个预编译正则，一次扫描完成全部替换
+_LATEX_LOOKUP = {**_LATEX_TABLE, **_LATEX_WORD_TABLE}
+_LATEX_BIG = re.compile(
+    f'{_alternation(_LATEX_TABLE)}|(?:{_alternation(_LATEX_WORD_TABLE)})\\b'
+)
+
+# 替换回调在模块级定义一次，避免每次调用都新建闭包
+def _latex_repl(match: re.Match) -> str:
+    return _LATEX_LOOKUP[match.group(0)]
+
+def _accent_repl(match: re.Match) -> str:
+    letter = match.group(2) or match.group(3)
+    return _ACCENT_MAP.get((match.group(1), letter), match.group(0))
+
+def _final_repl(match: re.Match) -> str:
+    escaped = match.group(1)
+    return ' ' if escaped is None else escaped
+
+# 剩余的反斜杠命令替换为空格、转义字符去掉反斜杠，合并为一次扫描；
+# 命令分支中可选的第二个反斜杠让 "\\cmd" 的结果与原先分两步处理时一致
+_FINAL_RE = re.compile(r'\\(?:\\?[a-zA-Z]+\s*|(.))')
+_WS_RE = re.compile(r'\s+')
+
+def _strip_braces(value: str) -> str:
+    """
+    移除任意嵌套深度的成对花括号，未配对的花括号原样保留
+    """
+    chars = list(value)
+    opened = []
+    for i, char in enumerate(value):
+        if char == '{':
+            opened.append(i)
+        elif char == '}' and opened:
+            chars[opened.pop()] = ''
+            chars[i] = ''
+    return ''.join(chars)
+
+def _clean_field_value(value: str) -> str:
     """
     清理BibTeX字段值，正确转换LaTeX特殊字符到Unicode字符
     """
     if not value:
         return ""
     
-    # LaTeX重音符号映射表
-    latex_mappings = {
-        # 波浪符 (~)
-        r'\\~\{n\}': 'ñ', r'\\~\{N\}': 'Ñ',
-        r'\\~\{a\}': 'ã', r'\\~\{A\}': 'Ã',
-        r'\\~\{o\}': 'õ', r'\\~\{O\}': 'Õ',
-        
-        # 尖音符 (')
-        r'\\\'?\{a\}': 'á', r'\\\'?\{A\}': 'Á',
-        r'\\\'?\{e\}': 'é', r'\\\'?\{E\}': 'É',
-        r'\\\'?\{i\}': 'í', r'\\\'?\{I\}': 'Í',
-        r'\\\'?\{o\}': 'ó', r'\\\'?\{O\}': 'Ó',
-        r'\\\'?\{u\}': 'ú', r'\\\'?\{U\}': 'Ú',
-        r'\\\'?\{y\}': 'ý', r'\\\'?\{Y\}': 'Ý',
-        r'\\\'?\{c\}': 'ć', r'\\\'?\{C\}': 'Ć',
-        
-        # 重音符 (`)
-        r'\\`\{a\}': 'à', r'\\`\{A\}': 'À',
-        r'\\`\{e\}': 'è', r'\\`\{E\}': 'È',
-        r'\\`\{i\}': 'ì', r'\\`\{I\}': 'Ì',
-        r'\\`\{o\}': 'ò', r'\\`\{O\}': 'Ò',
-        r'\\`\{u\}': 'ù', r'\\`\{U\}': 'Ù',
-        
-        # 分音符/元音变音 (")
-        r'\\"\{a\}': 'ä', r'\\"\{A\}': 'Ä',
-        r'\\"\{e\}': 'ë', r'\\"\{E\}': 'Ë',
-        r'\\"\{i\}': 'ï', r'\\"\{I\}': 'Ï',
-        r'\\"\{o\}': 'ö', r'\\"\{O\}': 'Ö',
-        r'\\"\{u\}': 'ü', r'\\"\{U\}': 'Ü',
-        
-        # 扬抑符 (^)
-        r'\\\^\{a\}': 'â', r'\\\^\{A\}': 'Â',
-        r'\\\^\{e\}': 'ê', r'\\\^\{E\}': 'Ê',
-        r'\\\^\{i\}': 'î', r'\\\^\{I\}': 'Î',
-        r'\\\^\{o\}': 'ô', r'\\\^\{O\}': 'Ô',
-        r'\\\^\{u\}': 'û', r'\\\^\{U\}': 'Û',
-        
-        # 软音符 cedilla (c)
-        r'\\c\{c\}': 'ç', r'\\c\{C\}': 'Ç',
+    # 大多数字段（尤其是较长的摘要）不含反斜杠或花括号，先做子串判断，
+    # 跳过不可能匹配的正则扫描
+    has_backslash = '\\' in value
+    
+    if has_backslash:
+        # 处理重音符号，如 \'{a} 或 \'a -> á
+        value = _ACCENT_RE.sub(_accent_repl, value)
         
-        # 其他特殊字符
-        r'\\ss\b': 'ß',  # 德语 eszett
-        r'\\ae\b': 'æ', r'\\AE\b': 'Æ',  # ae连字
-        r'\\oe\b': 'œ', r'\\OE\b': 'Œ',  # oe连字
-        r'\\o\b': 'ø', r'\\O\b': 'Ø',    # 斜杠o
-        r'\\aa\b': 'å', r'\\AA\b': 'Å',  # 环形a
+        # 应用其他LaTeX映射
+        value = _LATEX_BIG.sub(_latex_repl, value)
         
-        # 西班牙语倒置标点
-        r'\\textquestiondown\b': '¿',
-        r'\\textexclamdown\b': '¡',
-    }
-    
-    # 应用LaTeX映射
-    for latex_pattern, unicode_char in latex_mappings.items():
-        value = re.sub(latex_pattern, unicode_char, value)
-    
-    # 处理没有花括号的简单情况，如 \'a -> á
-    simple_mappings = {
-        r'\\~n\b': 'ñ', r'\\~N\b': 'Ñ',
-        r'\\\'a\b': 'á', r'\\\'A\b': 'Á', r'\\\'e\b': 'é', r'\\\'E\b': 'É',
-        r'\\\'i\b': 'í', r'\\\'I\b': 'Í', r'\\\'o\b': 'ó', r'\\\'O\b': 'Ó',
-        r'\\\'u\b': 'ú', r'\\\'U\b': 'Ú',
-        r'\\`a\b': 'à', r'\\`A\b': 'À', r'\\`e\b': 'è', r'\\`E\b': 'È',
-        r'\\`i\b': 'ì', r'\\`I\b': 'Ì', r'\\`o\b': 'ò', r'\\`O\b': 'Ò',
-        r'\\`u\b': 'ù', r'\\`U\b': 'Ù',
-        r'\\"a\b': 'ä', r'\\"A\b': 'Ä', r'\\"e\b': 'ë', r'\\"E\b': 'Ë',
-        r'\\"i\b': 'ï', r'\\"I\b': 'Ï', r'\\"o\b': 'ö', r'\\"O\b': 'Ö',
-        r'\\"u\b': 'ü', r'\\"U\b': 'Ü',
-    }
-    
-    for simple_pattern, unicode_char in simple_mappings.items():
-        value = re.sub(simple_pattern, unicode_char, value)
+        # 清理剩余的反斜杠命令（需在移除花括号之前进行，否则 \emph{x} 之类的命令会与参数连在一起被整体吞掉）
+        value = _FINAL_RE.sub(_final_repl, value)
     
     # 移除剩余的花括号
-    value = re.sub(r'\{([^{}]*)\}', r'\1', value)
+    if '{' in value:
+        value = _strip_braces(value)
     
     # 处理其他LaTeX命令
+    value = value.replace('---', '—')  # em-dash（需先于en-dash替换）
     value = value.replace('--', '–')  # en-dash
-    value = value.replace('---', '—')  # em-dash
     value = value.replace('``', '"')  # 左双引号
     value = value.replace("''", '"')  # 右双引号
-    value = value.replace('`', ''')   # 左单引号
-    value = value.replace("'", ''')   # 右单引号
-    
-    # 清理剩余的反斜杠命令
-    value = re.sub(r'\\[a-zA-Z]+\s*', ' ', value)
-    value = re.sub(r'\\(.)', r'\1', value)  # 移除转义字符前的反斜杠
     
     # 合并多个空格并去除首尾空格
-    value = re.sub(r'\s+', ' ', value)
+    value = _WS_RE.sub(' ', value)
     value = value.strip()
     
     return value
 
-def parse_bibtex_file(file_path: str) -> List[Dict[str, Any]]:
+# 作者、期刊、出版商、月份等字段在条目间大量重复，缓存清理结果；
+# 摘要、标题等较长的值几乎不重复，不进入缓存，以免挤掉短值并长期占用内存
+_CACHED_MAX_LEN = 256
+_clean_short_value = lru_cache(maxsize=4096)(_clean_field_value)
+
+def clean_field_value(value: str) -> str:
+    """
+    清理BibTeX字段值，较短的值经由缓存处理
+    """
+    if len(value) < _CACHED_MAX_LEN:
+        return _clean_short_value(value)
+    return _clean_field_value(value)
+
+# 需要提取的字段
+_FIELD_NAMES = frozenset({
+    'author', 'title', 'year', 'journal', 'booktitle', 'publisher',
+    'volume', 'number', 'pages', 'doi', 'url', 'abstract', 'keywords',
+    'location', 'series', 'isbn', 'issn', 'address', 'editor',
+    'organization', 'month', 'note', 'articleno', 'numpages', 'issue_date',
+})
+
+# 取值集中在少数几个的字段，解析时统一驻留
+_INTERNED_FIELDS = frozenset({'year', 'month'})
+
+def _decode(raw: bytes) -> str:
     """
-    解析BibTeX文件并返回文献条目列表
+    将字节串解码为字符串，UTF-8解码失败时回退到latin-1
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        return raw.decode('utf-8')
     except UnicodeDecodeError:
-        # 如果UTF-8解码失败，尝试其他编码
-        with open(file_path, 'r', encoding='latin-1') as f:
-            content = f.read()
-    
-    entries = []
-    
-    # 查找所有条目的起始位置
-    # entry_pattern = r'@(\w+)\{([^,\s]+),'
-    entry_pattern = r'@(\w+)\s*\{\s*([^,]+),'
-    entry_matches = list(re.finditer(entry_pattern, content))
-    
-    print(f"找到 {len(entry_matches)} 个文献条目")
-    
-    for i, match in enumerate(entry_matches):
-        entry_type = match.group(1).lower()
-        entry_key = match.group(2).strip()
-        
-        # 确定当前条目的结束位置
-        start_pos = match.start()
-        if i + 1 < len(entry_matches):
-            end_pos = entry_matches[i + 1].start()
+        return raw.decode('latin-1')
+
+def _find_closing_brace(text: bytes, start: int) -> int:
+    """
+    返回与 text[start] 处的 '{' 配对的 '}' 的位置，支持任意嵌套深度；未闭合时返回 -1
+    """
+    depth = 1
+    pos = start + 1
+    close = text.find(b'}', pos)
+    while close != -1:
+        opening = text.find(b'{', pos, close)
+        if opening == -1:
+            depth -= 1
+            if depth == 0:
+                return close
+            pos = close + 1
+            close = text.find(b'}', pos)
         else:
-            end_pos = len(content)
+            depth += 1
+            pos = opening + 1
+    return -1
+
+def _iter_entries(content: bytes, start: int = 0, stop: int = None):
+    """
+    以游标方式逐个定位 content[start:stop] 范围内的条目，产出 (条目类型, 引用键, 字段起始位置, 条目结束位置)
+    """
+    length = len(content) if stop is None else stop
+    cur = content.find(b'@', start, length)
+    while cur != -1:
+        pos = cur + 1
+        while pos < length and (content[pos:pos + 1].isalnum() or content[pos:pos + 1] == b'_'):
+            pos += 1
+        entry_type = content[cur + 1:pos].decode('latin-1')
+        while pos < length and content[pos:pos + 1].isspace():
+            pos += 1
+        if not entry_type or content[pos:pos + 1] != b'{':
+            cur = content.find(b'@', cur + 1)
+            continue
+        
+        end = _find_closing_brace(content, pos)
+        if end == -1:
+            # 花括号未闭合：条目截止到下一个行首的 '@'，其后的条目仍可正常解析
+            end = content.find(b'\n@', pos)
+            if end == -1:
+                end = len(content)
+        comma = content.find(b',', pos + 1, end)
+        if comma != -1:
+            yield entry_type, _decode(content[pos + 1:comma].strip()), comma + 1, end
+        cur = content.find(b'@', end, length)
+
+def _skip_value(content: bytes, pos: int, end: int) -> int:
+    """
+    跳过一个非花括号形式的字段值（"..." 或裸值），返回其后第一个位于引号和花括号之外的逗号位置；
+    找不到时返回 end
+    """
+    depth = 0
+    in_quotes = False
+    while pos < end:
+        char = content[pos:pos + 1]
+        if char == b'\\':
+            # 跳过转义字符，如 \"
+            pos += 2
+            continue
+        if char == b'{':
+            depth += 1
+        elif char == b'}':
+            if depth:
+                depth -= 1
+        elif char == b'"' and depth == 0:
+            in_quotes = not in_quotes
+        elif char == b',' and depth == 0 and not in_quotes:
+            return pos
+        pos += 1
+    return end
+
+def _iter_fields(content: bytes, pos: int, end: int):
+    """
+    单次扫描 content[pos:end] 范围内的字段，依次产出 (字段名, 未解码的原始字段值)
+    """
+    while True:
+        eq = content.find(b'=', pos, end)
+        if eq == -1:
+            return
+        segment = content[pos:eq]
+        field_name = segment.rsplit(b',', 1)[-1].strip().lower().decode('latin-1')
         
-        entry_content = content[start_pos:end_pos]
+        start = eq + 1
+        while start < end and content[start:start + 1].isspace():
+            start += 1
         
+        if content[start:start + 1] == b'{':
+            close = _find_closing_brace(content, start)
+            if close == -1 or close >= end:
+                return
+            yield field_name, content[start + 1:close]
+            pos = close + 1
+        else:
+            # 非花括号形式的值（如 "..." 或裸数字）不提取，跳到下一个字段
+            comma = _skip_value(content, start, end)
+            if comma >= end:
+                return
+            pos = comma + 1
+
+def _parse_chunk(content: bytes, start: int = 0, stop: int = None) -> Tuple[List[Dict[str, Any]], Counter, Counter]:
+    """
+    解析 content[start:stop] 范围内的完整条目，返回条目列表及按类型、按年份的计数
+    """
+    entries = []
+    type_counts = Counter()
+    year_counts = Counter()
+    
+    for entry_type, entry_key, fields_start, end_pos in _iter_entries(content, start, stop):
         # 初始化条目
         entry = {
-            'type': entry_type,
+            'type': sys.intern(entry_type.lower()),
             'key': entry_key
         }
         
-        # 定义要提取的字段
-        field_patterns = {
-            'author': r'author\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'title': r'title\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'year': r'year\s*=\s*\{([^}]+)\}',
-            'journal': r'journal\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'booktitle': r'booktitle\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'publisher': r'publisher\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'volume': r'volume\s*=\s*\{([^}]+)\}',
-            'number': r'number\s*=\s*\{([^}]+)\}',
-            'pages': r'pages\s*=\s*\{([^}]+)\}',
-            'doi': r'doi\s*=\s*\{([^}]+)\}',
-            'url': r'url\s*=\s*\{([^}]+)\}',
-            'abstract': r'abstract\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'keywords': r'keywords\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'location': r'location\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'series': r'series\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'isbn': r'isbn\s*=\s*\{([^}]+)\}',
-            'issn': r'issn\s*=\s*\{([^}]+)\}',
-            'address': r'address\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'editor': r'editor\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'organization': r'organization\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'month': r'month\s*=\s*\{([^}]+)\}',
-            'note': r'note\s*=\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}',
-            'articleno': r'articleno\s*=\s*\{([^}]+)\}',
-            'numpages': r'numpages\s*=\s*\{([^}]+)\}',
-            'issue_date': r'issue_date\s*=\s*\{([^}]+)\}'
-        }
-        
-        # 提取各个字段
-        for field_name, pattern in field_patterns.items():
-            match = re.search(pattern, entry_content, re.DOTALL | re.IGNORECASE)
-            if match:
-                field_value = clean_field_value(match.group(1))
-                entry[field_name] = field_value
+        # 提取各个字段，只在这里把字段值解码为字符串
+        for field_name, raw_value in _iter_fields(content, fields_start, end_pos):
+            if field_name in _FIELD_NAMES and field_name not in entry:
+                field_value = clean_field_value(_decode(raw_value))
+                # 取值重复度高的短字符串驻留为同一对象，减少内存占用
+                if field_name in _INTERNED_FIELDS or len(field_value) < 8:
+                    field_value = sys.intern(field_value)
+                entry[sys.intern(field_name)] = field_value
         
         entries.append(entry)
         
-        # 显示处理进度
-        if (i + 1) % 10 == 0 or i + 1 == len(entry_matches):
-            print(f"已处理 {i + 1}/{len(entry_matches)} 个条目")
+        # 解析的同时完成统计，无需之后再遍历条目列表
+        type_counts[entry['type']] += 1
+        year_counts[entry.get('year', 'unknown')] += 1
     
-    return entries
+    return entries, type_counts, year_counts
 
-def export_to_files(entries: List[Dict[str, Any]], output_excel: str):
+def _split_on_entries(content: bytes, parts: int):
     """
-    将文献条目导出到Excel和CSV文件
+    按条目边界把内容切分为大致相等的若干块，不会从条目中间切开；
+    逐块产出 (起始位置, 结束位置)，不复制内容
+    """
+    chunk_size = len(content) // parts + 1
+    start = 0
+    for _, _, _, end_pos in _iter_entries(content):
+        if end_pos + 1 - start >= chunk_size:
+            yield start, end_pos + 1
+            start = end_pos + 1
+    if start < len(content):
+        yield start, len(content)
+
+# 工作进程各自映射的文件内容，由 _init_worker 设置
+_worker_content = None
+
+def _init_worker(file_path: str):
+    """
+    工作进程启动时以只读内存映射方式打开文件，块内容无需经由进程间通信传递
+    """
+    global _worker_content
+    with open(file_path, 'rb') as f:
+        _worker_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _parse_range(bounds: Tuple[int, int]) -> Tuple[List[Dict[str, Any]], Counter, Counter]:
+    """
+    在工作进程中解析文件的一个块
     """
-    # 准备数据框
-    data = []
+    return _parse_chunk(_worker_content, *bounds)
+
+# 文件小于该大小时直接整体解析，避免分块及进程启动的开销超过收益
+_CHUNKED_MIN_SIZE = 8 * 1024 * 1024
+# 大文件每个CPU分配的块数：块越多，进度输出越细、进程间负载越均衡
+_CHUNKS_PER_WORKER = 4
+
+def _parse_content(content: mmap.mmap, file_path: str) -> Tuple[List[Dict[str, Any]], Counter, Counter]:
+    """
+    解析完整的文件内容，多核时大文件按条目边界分块，交给多个进程并行解析
+    """
+    if len(content) < _CHUNKED_MIN_SIZE:
+        return _parse_chunk(content)
     
-    for i, entry in enumerate(entries, 1):
-        row = {
-            '序号': i,
-            '类型': entry.get('type', ''),
-            '引用键': entry.get('key', ''),
-            '标题': entry.get('title', ''),
-            '作者': entry.get('author', ''),
-            '年份': entry.get('year', ''),
-            '期刊': entry.get('journal', ''),
-            '会议': entry.get('booktitle', ''),
-            '出版商': entry.get('publisher', ''),
-            '卷': entry.get('volume', ''),
-            '期': entry.get('number', ''),
-            '页码': entry.get('pages', ''),
-            'DOI': entry.get('doi', ''),
-            'URL': entry.get('url', ''),
-            '关键词': entry.get('keywords', ''),
-            '摘要': entry.get('abstract', ''),
-            '地点': entry.get('location', ''),
-            '系列': entry.get('series', ''),
-            'ISBN': entry.get('isbn', ''),
-            'ISSN': entry.get('issn', ''),
-            '地址': entry.get('address', ''),
-            '编辑': entry.get('editor', ''),
-            '组织': entry.get('organization', ''),
-            '月份': entry.get('month', ''),
-            '备注': entry.get('note', ''),
-            '文章号': entry.get('articleno', ''),
-            '页数': entry.get('numpages', ''),
-            '发行日期': entry.get('issue_date', '')
-        }
-        data.append(row)
+    workers = os.cpu_count() or 1
+    if workers == 1:
+        # 单核时分块只会多一次完整扫描，直接原地解析，只输出一行汇总
+        entries, type_counts, year_counts = _parse_chunk(content)
+        print(f"已处理 {len(entries)} 个条目")
+        return entries, type_counts, year_counts
+    
+    chunks = _split_on_entries(content, workers * _CHUNKS_PER_WORKER)
+    entries = []
+    type_counts = Counter()
+    year_counts = Counter()
+    pool = Pool(workers, initializer=_init_worker, initargs=(file_path,))
+    try:
+        results = pool.imap(_parse_range, chunks)
+        for chunk_entries, chunk_types, chunk_years in results:
+            entries.extend(chunk_entries)
+            type_counts.update(chunk_types)
+            year_counts.update(chunk_years)
+            # 显示处理进度（每完成一块输出一次，而不是每个条目输出一次）
+            print(f"已处理 {len(entries)} 个条目")
+    finally:
+        pool.terminate()
+    
+    return entries, type_counts, year_counts
+
+def parse_bibtex_file(file_path: str) -> Tuple[List[Dict[str, Any]], Counter, Counter]:
+    """
+    解析BibTeX文件，返回文献条目列表以及按类型、按年份的统计计数
+    """
+    # 以只读内存映射方式访问文件，按字节扫描，避免整体解码出一份完整的字符串副本
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            entries, type_counts, year_counts = [], Counter(), Counter()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                entries, type_counts, year_counts = _parse_content(content, file_path)
+    
+    print(f"找到 {len(entries)} 个文献条目")
+    
+    return entries, type_counts, year_counts
+
+# 条目字段与导出列名的对应关系（按列顺序）
+_EXPORT_COLUMNS = {
+    'type': '类型',
+    'key': '引用键',
+    'title': '标题',
+    'author': '作者',
+    'year': '年份',
+    'journal': '期刊',
+    'booktitle': '会议',
+    'publisher': '出版商',
+    'volume': '卷',
+    'number': '期',
+    'pages': '页码',
+    'doi': 'DOI',
+    'url': 'URL',
+    'keywords': '关键词',
+    'abstract': '摘要',
+    'location': '地点',
+    'series': '系列',
+    'isbn': 'ISBN',
+    'issn': 'ISSN',
+    'address': '地址',
+    'editor': '编辑',
+    'organization': '组织',
+    'month': '月份',
+    'note': '备注',
+    'articleno': '文章号',
+    'numpages': '页数',
+    'issue_date': '发行日期',
+}
+
+def _column_widths(df: pd.DataFrame) -> List[int]:
+    """
+    按列计算表头与单元格文本的最大长度，返回调整后的列宽（上限50）
+    """
+    widths = []
+    for column in df.columns:
+        max_length = len(str(column))
+        if len(df):
+            max_length = max(max_length, int(df[column].astype(str).str.len().max()))
+        # 设置最大列宽限制
+        widths.append(min(max_length + 2, 50))
+    return widths
+
+def _write_xlsx(df: pd.DataFrame, output_excel: str):
+    """
+    使用xlsxwriter的constant_memory模式逐行写出Excel，内存占用不随行数增长
+    """
+    workbook = xlsxwriter.Workbook(output_excel, {
+        'constant_memory': True,
+        # 与openpyxl的写出结果保持一致，不把文本自动转换为超链接或公式
+        'strings_to_urls': False,
+        'strings_to_formulas': False,
+    })
+    try:
+        worksheet = workbook.add_worksheet('文献信息')
+        
+        # constant_memory模式下已写出的行无法回改，列宽需预先计算
+        for i, width in enumerate(_column_widths(df)):
+            worksheet.set_column(i, i, width)
+        
+        # 表头不加样式，与原先pandas.to_excel的写出结果一致
+        worksheet.write_row(0, 0, df.columns)
+        # 逐个单元格写出：超过Excel上限（32767字符）的文本会被截断，
+        # 而 write_row 遇到这种情况会放弃该行剩余的单元格
+        for row_num, row in enumerate(df.itertuples(index=False, name=None), 1):
+            for col_num, value in enumerate(row):
+                worksheet.write(row_num, col_num, value)
+    finally:
+        workbook.close()
+
+# Excel单元格可容纳的最大字符数
+_EXCEL_MAX_CHARS = 32767
+
+def _write_xlsx_openpyxl(df: pd.DataFrame, output_excel: str):
+    """
+    使用openpyxl的write_only模式逐行写出Excel，不为每个单元格创建Cell对象
+    """
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet('文献信息')
+    
+    # write_only模式下列宽需在写入数据之前设置
+    for i, width in enumerate(_column_widths(df), 1):
+        worksheet.column_dimensions[get_column_letter(i)].width = width
     
-    # 创建DataFrame
-    df = pd.DataFrame(data)
+    # 表头不加样式，与原先pandas.to_excel的写出结果一致
+    worksheet.append(list(df.columns))
+    
+    # 空字符串写为空单元格，超长文本按Excel上限截断
+    for row in df.itertuples(index=False, name=None):
+        worksheet.append([
+            (value[:_EXCEL_MAX_CHARS] or None) if isinstance(value, str) else value
+            for value in row
+        ])
+    
+    workbook.save(output_excel)
+
+def export_to_files(entries: List[Dict[str, Any]], output_excel: str):
+    """
+    将文献条目导出到Excel和CSV文件
+    """
+    # 直接由条目字典构造DataFrame，按列顺序选取字段后统一改为中文列名
+    df = pd.DataFrame(entries, columns=list(_EXPORT_COLUMNS)).fillna('')
+    df.rename(columns=_EXPORT_COLUMNS, inplace=True)
+    df.insert(0, '序号', range(1, len(df) + 1))
     
     # 导出Excel文件
     try:
-        with pd.ExcelWriter(output_excel, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='文献信息', index=False)
-            
-            # 获取工作表以调整列宽
-            workbook = writer.book
-            worksheet = writer.sheets['文献信息']
-            
-            # 自动调整列宽
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                # 设置最大列宽限制
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+        if xlsxwriter is not None:
+            _write_xlsx(df, output_excel)
+        else:
+            _write_xlsx_openpyxl(df, output_excel)
         
         print(f"Excel文件已成功导出到: {output_excel}")
         
     except Exception as e:
         print(f"导出Excel文件时出错: {e}")
 
-def print_statistics(entries: List[Dict[str, Any]]):
+def print_statistics(type_counts: Counter, year_counts: Counter):
     """
-    打印文献统计信息
+    根据解析时得到的计数打印文献统计信息
     """
     print("\n=== 文献统计信息 ===")
-    print(f"总文献数量: {len(entries)}")
+    print(f"总文献数量: {sum(type_counts.values())}")
     
     # 按类型统计
-    type_counts = {}
-    for entry in entries:
-        entry_type = entry.get('type', 'unknown')
-        type_counts[entry_type] = type_counts.get(entry_type, 0) + 1
-    
     print("\n按类型分布:")
     for entry_type, count in sorted(type_counts.items()):
         print(f"  {entry_type}: {count} 篇")
     
     # 按年份统计
-    year_counts = {}
-    for entry in entries:
-        year = entry.get('year', 'unknown')
-        year_counts[year] = year_counts.get(year, 0) + 1
-    
     print("\n按年份分布:")
     for year, count in sorted(year_counts.items()):
         print(f"  {year}: {count} 篇")
@@ -325,14 +561,14 @@ def main():
     try:
         # 解析BibTeX文件
         print(f"\n正在解析BibTeX文件...")
-        entries = parse_bibtex_file(input_file)
+        entries, type_counts, year_counts = parse_bibtex_file(input_file)
         
         if not entries:
             print("未找到任何文献条目！")
             return
         
         # 打印统计信息
-        print_statistics(entries)
+        print_statistics(type_counts, year_counts)
         
         # 导出文件
         print(f"\n正在导出Excel文件...")